@@ -0,0 +1,164 @@
+'''
+Autore: Francesco Totaro
+Data: 18/07/2025
+Titolo: Progetto Esame Finale
+'''
+
+##
+## Funzioni:
+## Stadio di aggregazione tra le funzioni di raccolta (system_snapshot)
+## e la generazione delle sezioni del report. Ogni funzione scorre i dati
+## una sola volta e restituisce al massimo top_n righe (più una riga "Altri").
+##
+
+import heapq                                 # Per la selezione dei top-N gruppi
+import os                                    # Per ricavare la directory dei file
+
+
+SUMMARY_THRESHOLD = 50    # Oltre questo numero di righe la sezione viene riepilogata
+TOP_N = 20                # Numero massimo di gruppi mostrati nel riepilogo
+MAX_EXAMPLES = 3          # Numero di esempi riportati per ciascun gruppo
+
+
+def _add_example(examples, value):
+    '''
+    Funzione: _add_example
+    Aggiunge un valore alla lista degli esempi se non è già piena
+
+    Parametri formali:
+    list examples -> lista degli esempi del gruppo
+    str value     -> valore da aggiungere
+    '''
+    if value and len(examples) < MAX_EXAMPLES and value not in examples:
+        examples.append(value)
+
+
+def _top_groups(groups, top_n, make_row, make_other_row):
+    '''
+    Funzione: _top_groups
+    Seleziona i top_n gruppi con il conteggio più alto e riassume i restanti in una riga
+
+    Parametri formali:
+    dict groups              -> dizionario chiave -> dati del gruppo (il primo elemento è il conteggio)
+    int top_n                -> numero massimo di gruppi da restituire
+    callable make_row        -> funzione che converte (chiave, dati) in una riga della tabella
+    callable make_other_row  -> funzione che crea la riga riassuntiva (gruppi, conteggio)
+
+    Valore di ritorno:
+    list -> Lista di dizionari pronta per add_section
+    '''
+    top = heapq.nlargest(top_n, groups.items(), key=lambda item: item[1][0])
+    rows = [make_row(key, data) for key, data in top]
+
+    other_groups = len(groups) - len(top)
+    if other_groups > 0:
+        other_count = sum(data[0] for data in groups.values()) - sum(data[0] for _, data in top)
+        rows.append(make_other_row(other_groups, other_count))
+    return rows
+
+
+def aggregate_etc_modifications(rows, top_n=TOP_N):
+    '''
+    Funzione: aggregate_etc_modifications
+    Raggruppa le modifiche in /etc per directory, con numero di file e modifica più recente
+
+    Parametri formali:
+    iterable rows -> righe prodotte da get_recent_etc_modifications
+    int top_n     -> numero massimo di directory da mostrare (default TOP_N)
+
+    Valore di ritorno:
+    list -> Lista di dizionari con directory, numero di file e ultima modifica
+    '''
+    groups = {}
+    for row in rows:
+        directory = os.path.dirname(row.get("File", "")) or row.get("File", "")
+        timestamp = row.get("Last Modified", "")
+        group = groups.get(directory)
+        if group is None:
+            groups[directory] = [1, timestamp]
+        else:
+            group[0] += 1
+            # Il formato "%Y-%m-%d %H:%M:%S" permette il confronto tra stringhe
+            if timestamp > group[1]:
+                group[1] = timestamp
+
+    return _top_groups(
+        groups, top_n,
+        lambda directory, data: {"Directory": directory, "File": data[0], "Last Modified": data[1]},
+        lambda n, count: {"Directory": f"Altre {n} directory", "File": count, "Last Modified": ""}
+    )
+
+
+def aggregate_open_ports(rows, top_n=TOP_N):
+    '''
+    Funzione: aggregate_open_ports
+    Raggruppa le porte aperte per processo e protocollo
+
+    Parametri formali:
+    iterable rows -> righe prodotte da get_open_ports
+    int top_n     -> numero massimo di gruppi da mostrare (default TOP_N)
+
+    Valore di ritorno:
+    list -> Lista di dizionari con processo, protocollo, numero di porte ed esempi di indirizzi
+    '''
+    groups = {}
+    for row in rows:
+        key = (row.get("Process") or "-", row.get("Proto", ""))
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = [0, []]
+        group[0] += 1
+        _add_example(group[1], row.get("Local Address", ""))
+
+    return _top_groups(
+        groups, top_n,
+        lambda key, data: {"Process": key[0], "Proto": key[1], "Porte": data[0], "Esempi": ", ".join(data[1])},
+        lambda n, count: {"Process": f"Altri {n} gruppi", "Proto": "", "Porte": count, "Esempi": ""}
+    )
+
+
+def aggregate_services(rows, top_n=TOP_N):
+    '''
+    Funzione: aggregate_services
+    Raggruppa i servizi per stato, con numero di servizi ed alcuni esempi
+
+    Parametri formali:
+    iterable rows -> righe prodotte da get_active_services
+    int top_n     -> numero massimo di stati da mostrare (default TOP_N)
+
+    Valore di ritorno:
+    list -> Lista di dizionari con stato, numero di servizi ed esempi
+    '''
+    groups = {}
+    for row in rows:
+        state = row.get("State") or "sconosciuto"
+        group = groups.get(state)
+        if group is None:
+            group = groups[state] = [0, []]
+        group[0] += 1
+        _add_example(group[1], row.get("Service", ""))
+
+    return _top_groups(
+        groups, top_n,
+        lambda state, data: {"State": state, "Servizi": data[0], "Esempi": ", ".join(data[1])},
+        lambda n, count: {"State": f"Altri {n} stati", "Servizi": count, "Esempi": ""}
+    )
+
+
+def summarize(rows, aggregator, threshold=SUMMARY_THRESHOLD, top_n=TOP_N):
+    '''
+    Funzione: summarize
+    Applica l'aggregatore solo se la sezione supera la soglia di righe
+
+    Parametri formali:
+    list rows           -> righe complete della sezione
+    callable aggregator -> funzione di aggregazione da applicare
+    int threshold       -> numero di righe oltre il quale riepilogare (default SUMMARY_THRESHOLD)
+    int top_n           -> numero massimo di gruppi del riepilogo (default TOP_N)
+
+    Valore di ritorno:
+    tuple -> (righe da mostrare, True se il contenuto è stato riepilogato)
+    '''
+    if threshold is None or len(rows) <= threshold:
+        return rows, False
+    return aggregator(rows, top_n), True
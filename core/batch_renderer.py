@@ -0,0 +1,103 @@
+'''
+Autore: Francesco Totaro
+Data: 18/07/2025
+Titolo: Progetto Esame Finale
+'''
+
+##
+## Funzioni:
+## Rendering in batch di più snapshot tramite un pool di processi.
+## Ogni worker prepara una sola volta il logo già compresso e mantiene la
+## cache dei testi troncati, riusandoli per tutti i report che gli vengono assegnati.
+##
+
+import os                                            # Per ricavare il nome del PDF dal file JSON
+from concurrent.futures import ProcessPoolExecutor   # Pool di processi per il rendering parallelo
+from datetime import datetime                        # Per leggere la data di acquisizione dello snapshot
+from .report_generator import PDFReport, preload_resources, load_snapshot
+
+
+def _render_job(job):
+    '''
+    Funzione: _render_job
+    Genera un singolo report PDF all'interno di un processo worker.
+    Gli errori vengono restituiti invece che sollevati, così un job fallito non interrompe il batch.
+
+    Parametri formali:
+    tuple job -> coppia (nome file PDF, snapshot)
+
+    Valore di ritorno:
+    tuple -> (nome del file PDF, None) se generato, (nome del file PDF, Exception) in caso di errore
+    '''
+    filename, snapshot = job
+    try:
+        timestamp = snapshot.get("timestamp")
+        generated_at = datetime.fromisoformat(timestamp) if timestamp else None
+        pdf = PDFReport(filename=filename, generated_at=generated_at)
+        pdf.render_snapshot(snapshot)
+    except Exception as e:
+        # Il tipo originale è riportato nel messaggio perché il traceback non attraversa il pool di processi
+        error = Exception(f"Errore durante il rendering di {filename}: {type(e).__name__}: {str(e)}")
+        error.__cause__ = e
+        return filename, error
+    return filename, None
+
+
+def _render_file_job(snapshot_file):
+    '''
+    Funzione: _render_file_job
+    Legge uno snapshot salvato in JSON e genera il relativo report PDF accanto al file
+
+    Parametri formali:
+    str snapshot_file -> percorso del file JSON dello snapshot
+
+    Valore di ritorno:
+    tuple -> (nome del file PDF, None) se generato, (nome del file PDF, Exception) in caso di errore
+    '''
+    filename = os.path.splitext(snapshot_file)[0] + ".pdf"
+    try:
+        snapshot = load_snapshot(snapshot_file)
+    except Exception as e:
+        error = Exception(f"Errore nella lettura di {snapshot_file}: {type(e).__name__}: {str(e)}")
+        error.__cause__ = e
+        return filename, error
+    return _render_job((filename, snapshot))
+
+
+def render_reports(jobs, max_workers=None, chunksize=1):
+    '''
+    Funzione: render_reports
+    Genera in parallelo i report PDF di una lista di snapshot già raccolti.
+    Un job fallito non interrompe gli altri: il suo errore viene riportato nel risultato.
+
+    Parametri formali:
+    iterable jobs   -> coppie (nome file PDF, snapshot) da generare
+    int max_workers -> numero di processi worker (default: numero di core)
+    int chunksize   -> numero di report inviati a ogni worker per volta (default 1)
+
+    Valore di ritorno:
+    list -> Lista di coppie (nome file PDF, errore) nello stesso ordine dei job;
+            errore è None se il report è stato generato, altrimenti l'eccezione del job
+    '''
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=preload_resources) as executor:
+        return list(executor.map(_render_job, jobs, chunksize=chunksize))
+
+
+def render_snapshot_files(snapshot_files, max_workers=None, chunksize=1):
+    '''
+    Funzione: render_snapshot_files
+    Rigenera in parallelo i report PDF a partire dagli snapshot JSON salvati accanto ai report.
+    I file vengono letti direttamente nei worker, senza trasferire i dati dal processo principale.
+    Un file illeggibile o malformato non interrompe gli altri: il suo errore viene riportato nel risultato.
+
+    Parametri formali:
+    iterable snapshot_files -> percorsi dei file JSON degli snapshot
+    int max_workers         -> numero di processi worker (default: numero di core)
+    int chunksize           -> numero di report inviati a ogni worker per volta (default 1)
+
+    Valore di ritorno:
+    list -> Lista di coppie (nome file PDF, errore) nello stesso ordine dei file;
+            errore è None se il report è stato generato, altrimenti l'eccezione del job
+    '''
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=preload_resources) as executor:
+        return list(executor.map(_render_file_job, snapshot_files, chunksize=chunksize))
@@ -8,15 +8,161 @@ Titolo: Progetto Esame Finale
 ## Funzioni e classi:
 ##
 
+import fpdf                                   # Per verificare la versione di fpdf2
 from fpdf import FPDF                         # Libreria per creare file PDF
 from datetime import datetime                 # Per ottenere data e ora attuali
+from functools import lru_cache               # Cache del logo già elaborato
+import copy                                   # Per duplicare le informazioni del logo in ogni report
 from .system_snapshot import (                # Importazione delle funzioni di snapshot del sistema
     get_active_services, 
     get_logged_users, 
     get_open_ports, 
     get_recent_etc_modifications
 )
+from .aggregator import (                     # Stadio di aggregazione per le sezioni troppo lunghe
+    SUMMARY_THRESHOLD,
+    TOP_N,
+    aggregate_services,
+    aggregate_open_ports,
+    aggregate_etc_modifications,
+    summarize
+)
 import os                                     # Libreria per operazioni su file e percorsi
+import json                                   # Per salvare i dati completi dello snapshot
+
+
+LOGO_PATH = os.path.join("assets", "logo.png")
+# Versioni di fpdf2 per cui è verificata la struttura interna della cache immagini
+# (image_cache.images, chiavi "i" e "usages") usata per riusare il logo tra i report
+LOGO_REUSE_FPDF_VERSIONS = ((2, 8),)
+TRUNCATE_CACHE_SIZE = 20000   # Numero massimo di testi troncati mantenuti in cache per processo
+_truncate_cache = {}           # (font, stile, dimensione, testo, larghezza) -> testo troncato
+
+
+def _image_cache(pdf):
+    '''
+    Funzione: _image_cache
+    Ritorna il dizionario delle immagini di un documento fpdf2 (nome -> informazioni immagine)
+
+    Parametri formali:
+    FPDF pdf -> documento di cui leggere la cache immagini
+
+    Valore di ritorno:
+    dict -> cache immagini del documento
+    '''
+    return pdf.image_cache.images
+
+
+def _supports_logo_reuse():
+    '''
+    Funzione: _supports_logo_reuse
+    Verifica che la versione installata di fpdf2 sia tra quelle per cui il riuso del logo è verificato
+
+    Valore di ritorno:
+    bool -> True se la cache immagini di fpdf2 ha la struttura attesa
+    '''
+    try:
+        version = tuple(int(part) for part in fpdf.__version__.split(".")[:2])
+    except (AttributeError, ValueError):
+        return False
+    return version in LOGO_REUSE_FPDF_VERSIONS
+
+
+@lru_cache(maxsize=None)
+def load_logo_info(logo_path=LOGO_PATH):
+    '''
+    Funzione: load_logo_info
+    Legge, decodifica e comprime il logo una sola volta per processo tramite fpdf2,
+    così che ogni report possa riusarne i dati già pronti per l'inserimento nel PDF
+
+    Parametri formali:
+    str logo_path -> percorso dell'immagine del logo (default assets/logo.png)
+
+    Valore di ritorno:
+    tuple|None -> (nome, informazioni immagine fpdf2), None se assente, non leggibile
+                  o se la versione di fpdf2 non permette il riuso
+    '''
+    if not os.path.exists(logo_path) or not _supports_logo_reuse():
+        return None
+    try:
+        pdf = FPDF()
+        pdf.add_page()
+        pdf.image(logo_path, x=10, y=8, w=30)
+        name, info = next(iter(_image_cache(pdf).items()))
+    except Exception:
+        return None
+    # Un profilo ICC è salvato a parte nel documento e non può essere riusato tra report
+    if not {"data", "i", "usages"} <= set(info) or info.get("iccp") is not None:
+        return None
+    return name, info
+
+
+def preload_resources():
+    '''
+    Funzione: preload_resources
+    Carica in anticipo il logo già elaborato, utile come inizializzazione
+    dei processi worker del rendering in batch
+    '''
+    load_logo_info()
+
+
+def collect_snapshot():
+    '''
+    Funzione: collect_snapshot
+    Raccoglie i dati completi dello snapshot richiamando le funzioni del modulo system_snapshot
+
+    Valore di ritorno:
+    dict -> Dati dello snapshot con data di acquisizione (formato ISO)
+    '''
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "services": get_active_services(),
+        "users": get_logged_users(),
+        "ports": get_open_ports(),
+        "etc": get_recent_etc_modifications()
+    }
+
+
+def snapshot_path(report_filename):
+    '''
+    Funzione: snapshot_path
+    Ritorna il percorso del file JSON con i dati completi associato a un report
+
+    Parametri formali:
+    str report_filename -> percorso del file PDF
+
+    Valore di ritorno:
+    str -> percorso del file JSON (stesso nome del PDF, estensione .json)
+    '''
+    return os.path.splitext(report_filename)[0] + ".json"
+
+
+def save_snapshot(snapshot, path):
+    '''
+    Funzione: save_snapshot
+    Salva i dati completi (non riepilogati) di uno snapshot in formato JSON
+
+    Parametri formali:
+    dict snapshot -> Dati dello snapshot
+    str path      -> percorso del file JSON da scrivere
+    '''
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False)
+
+
+def load_snapshot(path):
+    '''
+    Funzione: load_snapshot
+    Legge uno snapshot salvato con save_snapshot
+
+    Parametri formali:
+    str path -> percorso del file JSON
+
+    Valore di ritorno:
+    dict -> Dati dello snapshot
+    '''
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
 
 
 class PDFReport(FPDF):
@@ -25,14 +171,21 @@ class PDFReport(FPDF):
     Estende la classe FPDF per generare un report PDF automatizzato
     '''
 
-    def __init__(self, filename=None):
+    def __init__(self, filename=None, summary_threshold=SUMMARY_THRESHOLD, top_n=TOP_N, generated_at=None):
         '''
         Metodo: __init__
         Inizializza il report, imposta font, margini, logo e header
         Parametri:
         str filename (opzionale) -> nome file PDF da generare. Se non fornito, viene generato automaticamente.
+        int summary_threshold (opzionale) -> righe oltre le quali una sezione viene riepilogata (None per disattivare)
+        int top_n (opzionale) -> numero massimo di gruppi mostrati nei riepiloghi
+        datetime generated_at (opzionale) -> data riportata nell'intestazione. Se non fornita, viene usata quella attuale.
         '''
         super().__init__()
+        self.generated_at = generated_at or datetime.now()
+        self.summary_threshold = summary_threshold
+        self.top_n = top_n
+        self.snapshot = {}                              # Dati completi raccolti, non riepilogati
         self.set_auto_page_break(auto=True, margin=15)  # Imposta il margine di fine pagina
         self.set_font("Helvetica", size=12)             # Font di default
         self.add_page()                                 # Aggiunge la prima pagina
@@ -55,15 +208,29 @@ class PDFReport(FPDF):
         Funzione: _add_logo
         Inserisce un logo nell'intestazione del PDF se presente nella directory assets
         '''
-        logo_path = os.path.join("assets", "logo.png")
-        if os.path.exists(logo_path):
-            try:
-                self.image(logo_path, x=10, y=8, w=30)
-                self.ln(25)
-            except Exception:
-                # Se il logo non può essere caricato, continua senza errori
-                self.ln(5)
-        else:
+        logo = load_logo_info()
+        if logo is None and not os.path.exists(LOGO_PATH):
+            self.ln(5)
+            return
+        try:
+            if logo is not None:
+                # Registra nella cache del documento i dati già compressi del logo,
+                # così fpdf2 non rilegge né ricomprime l'immagine.
+                # Dipende dalla struttura interna di fpdf2: vedi LOGO_REUSE_FPDF_VERSIONS
+                name, info = logo
+                images = _image_cache(self)
+                if name not in images:
+                    info = copy.copy(info)
+                    info["i"] = len(images) + 1
+                    info["usages"] = 0
+                    images[name] = info
+                self.image(name, x=10, y=8, w=30)
+            else:
+                # Versione di fpdf2 non verificata: inserimento standard del logo
+                self.image(LOGO_PATH, x=10, y=8, w=30)
+            self.ln(25)
+        except Exception:
+            # Se il logo non può essere caricato, continua senza errori
             self.ln(5)
 
     def _add_header(self):
@@ -78,7 +245,7 @@ class PDFReport(FPDF):
         # Aggiunge la data di generazione
         self.set_font("Helvetica", size=10)
         self.set_text_color(100, 100, 100)
-        current_time = datetime.now().strftime("%d/%m/%Y - %H:%M:%S")
+        current_time = self.generated_at.strftime("%d/%m/%Y - %H:%M:%S")
         self.cell(0, 8, f"Generato il: {current_time}", 0, 1, 'C')
         
         # Linea separatrice
@@ -99,14 +266,23 @@ class PDFReport(FPDF):
         Valore di ritorno:
         str -> testo troncato se necessario
         '''
-        if self.get_string_width(text) <= max_width:
-            return text
-        
-        # Tronca il testo e aggiunge "..."
-        while len(text) > 3 and self.get_string_width(text + "...") > max_width:
-            text = text[:-1]
-        
-        return text + "..." if len(text) > 0 else "..."
+        # I risultati dipendono solo dal font corrente, quindi sono riusabili tra report dello stesso processo
+        key = (self.font_family, self.font_style, self.font_size_pt, text, max_width)
+        cached = _truncate_cache.get(key)
+        if cached is not None:
+            return cached
+
+        truncated = text
+        if self.get_string_width(truncated) > max_width:
+            # Tronca il testo e aggiunge "..."
+            while len(truncated) > 3 and self.get_string_width(truncated + "...") > max_width:
+                truncated = truncated[:-1]
+            truncated = truncated + "..." if len(truncated) > 0 else "..."
+
+        if len(_truncate_cache) >= TRUNCATE_CACHE_SIZE:
+            _truncate_cache.clear()
+        _truncate_cache[key] = truncated
+        return truncated
 
     def _add_table(self, data, headers=None):
         '''
@@ -220,39 +396,68 @@ class PDFReport(FPDF):
 
         self.ln(8)
 
+    def add_summarized_section(self, title, rows, aggregator):
+        '''
+        Funzione: add_summarized_section
+        Aggiunge una sezione tabellare, riepilogandola con l'aggregatore se supera la soglia
+
+        Parametri formali:
+        str title           -> Titolo della sezione
+        list rows           -> Righe complete della sezione
+        callable aggregator -> Funzione di aggregazione del modulo aggregator
+        '''
+        content, summarized = summarize(rows, aggregator, self.summary_threshold, self.top_n)
+        if summarized:
+            title = f"{title} (riepilogo di {len(rows)} voci)"
+        self.add_section(title, content)
+
     def generate_full_report(self):
         '''
         Funzione: generate_full_report
         Genera tutte le sezioni del report richiamando le funzioni del modulo system_snapshot
+        e salva accanto al PDF i dati completi dello snapshot in formato JSON
         '''
         try:
-            # Assicurati che la cartella reports esista
-            os.makedirs("reports", exist_ok=True)
-            
-            # Genera le sezioni del report
-            self.add_section("Servizi Attivi", get_active_services())
-            self.add_section("Utenti Connessi", get_logged_users())
-            self.add_section("Porte Aperte", get_open_ports())
-            self.add_section("Modifiche Recenti in /etc", get_recent_etc_modifications())
-            
-            # Aggiunge una nota finale
-            self.add_page()
-            self.set_font("Helvetica", "B", 12)
-            self.set_text_color(0, 70, 130)
-            self.cell(0, 10, "Note", 0, 1, 'L')
-            self.ln(5)
-            
-            self.set_font("Helvetica", size=10)
-            self.set_text_color(0, 0, 0)
-            note_text = (
-                "Questo report è stato generato automaticamente da SnapAudit.\n"
-                "Le informazioni mostrate riflettono lo stato del sistema al momento della generazione.\n"
-                "Per informazioni aggiornate, generare un nuovo report."
-            )
-            self.multi_cell(0, 6, note_text, 0, 'L')
-            
-            # Salva il file
-            self.output(self.filename)
-            
+            self.render_snapshot(collect_snapshot())
+            save_snapshot(self.snapshot, snapshot_path(self.filename))
         except Exception as e:
             raise Exception(f"Errore durante la generazione del report: {str(e)}")
+
+    def render_snapshot(self, snapshot):
+        '''
+        Funzione: render_snapshot
+        Genera le sezioni del report a partire da uno snapshot già raccolto e salva il file PDF
+
+        Parametri formali:
+        dict snapshot -> Dati dello snapshot (come restituiti da collect_snapshot)
+        '''
+        # Assicurati che la cartella di destinazione esista
+        os.makedirs(os.path.dirname(self.filename) or ".", exist_ok=True)
+
+        self.snapshot = snapshot
+
+        # Genera le sezioni del report (riepilogate se troppo lunghe)
+        self.add_summarized_section("Servizi in Esecuzione o in Errore", snapshot.get("services", []), aggregate_services)
+        self.add_section("Utenti Connessi", snapshot.get("users", []))
+        self.add_summarized_section("Porte Aperte", snapshot.get("ports", []), aggregate_open_ports)
+        self.add_summarized_section("Modifiche Recenti in /etc", snapshot.get("etc", []), aggregate_etc_modifications)
+        
+        # Aggiunge una nota finale
+        self.add_page()
+        self.set_font("Helvetica", "B", 12)
+        self.set_text_color(0, 70, 130)
+        self.cell(0, 10, "Note", 0, 1, 'L')
+        self.ln(5)
+        
+        self.set_font("Helvetica", size=10)
+        self.set_text_color(0, 0, 0)
+        note_text = (
+            "Questo report è stato generato automaticamente da SnapAudit.\n"
+            "Le informazioni mostrate riflettono lo stato del sistema al momento della generazione.\n"
+            "Per informazioni aggiornate, generare un nuovo report."
+        )
+        self.multi_cell(0, 6, note_text, 0, 'L')
+        
+        # Salva il file
+        self.output(self.filename)
+
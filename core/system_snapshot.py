@@ -9,6 +9,7 @@ Titolo: Progetto Esame Finale
 ##
 
 import subprocess                            # Per eseguire comandi di sistema
+import re                                    # Per estrarre il nome del processo dall'output di ss
 import os                                    # Per operazioni su file system
 from datetime import datetime, timedelta     # Per gestione date e intervalli temporali
 
@@ -16,26 +17,31 @@ from datetime import datetime, timedelta     # Per gestione date e intervalli te
 def get_active_services():
     '''
     Funzione: get_active_services
-    Ottiene la lista dei servizi attivi sul sistema tramite systemctl
+    Ottiene la lista dei servizi in esecuzione o in errore sul sistema tramite systemctl
 
     Valore di ritorno:
-    list -> Lista di dizionari con nome del servizio e descrizione
+    list -> Lista di dizionari con nome del servizio, stato (ACTIVE/SUB) e descrizione
     '''
     try:
         output = subprocess.check_output(
-            ["systemctl", "list-units", "--type=service", "--state=running", "--no-pager", "--no-legend"],
+            ["systemctl", "list-units", "--type=service", "--state=running,failed", "--no-pager", "--no-legend"],
             text=True
         )
         services = []
         for line in output.strip().split('\n'):
             parts = line.split()
+            # Le unità in errore sono precedute dal simbolo "●"
+            if parts and parts[0] == "●":
+                parts = parts[1:]
             if parts:
-                # Il nome del servizio è il primo elemento, la descrizione parte dal quinto elemento in poi
-                services.append({"Service": parts[0], "Description": " ".join(parts[4:])})
+                # Il nome del servizio è il primo elemento, lo stato attivo e il sottostato il terzo e il quarto,
+                # la descrizione parte dal quinto elemento in poi
+                state = "/".join(parts[2:4])
+                services.append({"Service": parts[0], "State": state, "Description": " ".join(parts[4:])})
         return services
     except Exception as e:
         # In caso di errore, ritorna un dizionario con la descrizione dell'eccezione
-        return [{"Service": "Errore", "Description": str(e)}]
+        return [{"Service": "Errore", "State": "", "Description": str(e)}]
 
 
 def get_logged_users():
@@ -64,10 +70,11 @@ def get_open_ports():
     Ottiene l'elenco delle porte TCP/UDP aperte utilizzando il comando 'ss'
 
     Valore di ritorno:
-    list -> Lista di dizionari con protocollo e indirizzo locale
+    list -> Lista di dizionari con protocollo, indirizzo locale e processo in ascolto
     '''
     try:
-        output = subprocess.check_output(["ss", "-tuln"], text=True)
+        # L'opzione -p aggiunge il processo (visibile solo con permessi sufficienti)
+        output = subprocess.check_output(["ss", "-tulnp"], text=True)
         ports = []
         lines = output.strip().split('\n')
         for line in lines[1:]:  # Salta l’intestazione
@@ -75,10 +82,12 @@ def get_open_ports():
             if len(parts) >= 5:
                 proto = parts[0]
                 local_address = parts[4]
-                ports.append({"Proto": proto, "Local Address": local_address})
+                match = re.search(r'users:\(\("([^"]+)"', " ".join(parts[6:]))
+                process = match.group(1) if match else ""
+                ports.append({"Proto": proto, "Local Address": local_address, "Process": process})
         return ports
     except Exception as e:
-        return [{"Proto": "Errore", "Local Address": str(e)}]
+        return [{"Proto": "Errore", "Local Address": str(e), "Process": ""}]
 
 
 def get_recent_etc_modifications(days=7):
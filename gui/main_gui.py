@@ -14,13 +14,14 @@ import sys
 import os
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QLabel,
-    QFileDialog, QListWidget, QMessageBox, QHBoxLayout, QCheckBox
+    QFileDialog, QListWidget, QMessageBox, QHBoxLayout, QCheckBox, QSplitter
 )
 from PyQt6.QtGui import QPixmap
 from PyQt6.QtCore import Qt
 
-from core.report_generator import PDFReport                    # Importa la classe per generare PDF
+from core.report_generator import PDFReport, snapshot_path     # Classe per generare PDF e percorso dei dati completi
 from core.system_snapshot import get_reports_list              # Funzione per ottenere la lista dei report
+from gui.pdf_viewer import PdfViewerPane, HAS_QTPDF            # Visualizzatore PDF integrato (se QtPdf è disponibile)
 import subprocess
 
 
@@ -32,7 +33,7 @@ class MainGUI(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("SnapAudit - Sistema di Audit")
-        self.setGeometry(100, 100, 800, 600)  # Posizione iniziale e dimensioni finestra
+        self.setGeometry(100, 100, 1100, 700) # Posizione iniziale e dimensioni finestra
         self.is_dark_theme = False            # Tema iniziale: chiaro
         self._setup_ui()                      # Costruzione interfaccia
         self.apply_theme()                    # Applicazione tema
@@ -64,7 +65,19 @@ class MainGUI(QWidget):
         # Lista dei report disponibili
         self.report_list = QListWidget()
         self._load_report_list()
-        layout.addWidget(self.report_list)
+
+        # Visualizzatore integrato accanto alla lista, se QtPdf è disponibile
+        if HAS_QTPDF:
+            self.pdf_viewer = PdfViewerPane()
+            self.report_list.currentItemChanged.connect(self._preview_selected_report)
+            splitter = QSplitter(Qt.Orientation.Horizontal)
+            splitter.addWidget(self.report_list)
+            splitter.addWidget(self.pdf_viewer)
+            splitter.setStretchFactor(1, 1)
+            layout.addWidget(splitter)
+        else:
+            self.pdf_viewer = None
+            layout.addWidget(self.report_list)
 
         # Sezione bottoni
         button_layout = QHBoxLayout()
@@ -167,10 +180,24 @@ class MainGUI(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Errore", f"Errore durante la generazione del report:\n{str(e)}")
 
+    def _preview_selected_report(self, current, previous=None):
+        '''
+        Funzione: _preview_selected_report
+        Mostra nel visualizzatore integrato il report appena selezionato nella lista
+
+        Parametri formali:
+        QListWidgetItem current  -> elemento selezionato
+        QListWidgetItem previous -> elemento selezionato in precedenza (non usato)
+        '''
+        if current is None or "Nessun report trovato" in current.text():
+            return
+        self.pdf_viewer.load(os.path.join("reports", current.text()))
+
     def view_selected_report(self):
         '''
         Funzione: view_selected_report
-        Apre il report PDF selezionato nella lista con il programma predefinito
+        Apre il report PDF selezionato nella lista nel visualizzatore integrato
+        o, se non disponibile, con il programma predefinito
         '''
         selected = self.report_list.currentItem()
         if not selected or "Nessun report trovato" in selected.text():
@@ -180,6 +207,10 @@ class MainGUI(QWidget):
         if not os.path.exists(report_path):
             QMessageBox.warning(self, "Errore", "File report non trovato.")
             return
+        if self.pdf_viewer is not None:
+            if not self.pdf_viewer.load(report_path):
+                QMessageBox.warning(self, "Errore", "Impossibile aprire il report nel visualizzatore.")
+            return
         try:
             if sys.platform.startswith('linux'):
                 subprocess.run(['xdg-open', report_path], check=False)
@@ -209,7 +240,13 @@ class MainGUI(QWidget):
         )
         if reply == QMessageBox.StandardButton.Yes:
             try:
+                if self.pdf_viewer is not None:
+                    self.pdf_viewer.forget(report_path)
                 os.remove(report_path)
+                # Elimina anche i dati completi dello snapshot, se presenti
+                data_path = snapshot_path(report_path)
+                if os.path.exists(data_path):
+                    os.remove(data_path)
                 self._load_report_list()
                 QMessageBox.information(self, "Eliminato", "Report eliminato correttamente.")
             except Exception as e:
@@ -7,6 +7,23 @@ Titolo: Progetto Esame Finale
 import subprocess
 import platform
 import os
+from collections import OrderedDict                   # Per le cache LRU di documenti e miniature
+
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QListWidget, QListWidgetItem, QListView, QSplitter
+from PyQt6.QtGui import QIcon, QPixmap
+from PyQt6.QtCore import Qt, QSize, QPoint, QPointF, QTimer
+
+# QtPdf è un modulo opzionale di PyQt6: se non è disponibile si usa il visualizzatore esterno
+try:
+    from PyQt6.QtPdf import QPdfDocument
+    from PyQt6.QtPdfWidgets import QPdfView
+    HAS_QTPDF = True
+except ImportError:
+    HAS_QTPDF = False
+
+DOCUMENT_CACHE_SIZE = 8       # Numero di documenti aperti mantenuti in memoria
+THUMBNAIL_CACHE_SIZE = 300    # Numero di miniature mantenute in memoria
+THUMBNAIL_WIDTH = 110         # Larghezza delle miniature in pixel
 
 def open_pdf(filepath):
     '''
@@ -34,3 +51,263 @@ def open_pdf(filepath):
         subprocess.call(["open", filepath])
     else:  # Linux e altri sistemi Unix-like
         subprocess.call(["xdg-open", filepath])
+
+
+class PdfViewerPane(QWidget):
+    '''
+    Classe: PdfViewerPane
+    Pannello per visualizzare i PDF direttamente nella GUI tramite QtPdf.
+    Le pagine vengono renderizzate solo quando visibili; documenti aperti di recente
+    e miniature delle pagine sono mantenuti in cache LRU.
+    '''
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._documents = OrderedDict()       # (percorso, mtime) -> QPdfDocument
+        self._thumbnails = OrderedDict()      # (percorso, mtime, pagina) -> QPixmap
+        self._current_key = None              # Chiave del documento visualizzato
+        self._icon_rows = set()               # Righe che mostrano attualmente una miniatura
+        self._setup_ui()
+
+    def _setup_ui(self):
+        '''
+        Funzione: _setup_ui
+        Inizializza la colonna delle miniature e la vista del documento
+        '''
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+
+        # Colonna delle miniature (renderizzate solo per le righe visibili)
+        self.thumbnail_list = QListWidget()
+        self.thumbnail_list.setIconSize(QSize(THUMBNAIL_WIDTH, int(THUMBNAIL_WIDTH * 1.42)))
+        # Colonna singola con l'etichetta della pagina sotto la miniatura
+        self.thumbnail_list.setViewMode(QListView.ViewMode.IconMode)
+        self.thumbnail_list.setFlow(QListView.Flow.TopToBottom)
+        self.thumbnail_list.setWrapping(False)
+        self.thumbnail_list.setMovement(QListView.Movement.Static)
+        self.thumbnail_list.setUniformItemSizes(True)
+        self.thumbnail_list.setMaximumWidth(THUMBNAIL_WIDTH + 60)
+        self.thumbnail_list.currentRowChanged.connect(self._jump_to_page)
+        self.thumbnail_list.verticalScrollBar().valueChanged.connect(self._render_visible_thumbnails)
+        splitter.addWidget(self.thumbnail_list)
+
+        # Vista del documento: QPdfView renderizza solo le pagine visibili
+        self.view = QPdfView(splitter)
+        self.view.setPageMode(QPdfView.PageMode.MultiPage)
+        self.view.setZoomMode(QPdfView.ZoomMode.FitToWidth)
+        self.view.pageNavigator().currentPageChanged.connect(self._sync_thumbnail)
+        splitter.addWidget(self.view)
+
+        splitter.setStretchFactor(1, 1)
+        splitter.setSizes([THUMBNAIL_WIDTH + 60, 10000])    # Lo spazio restante va alla vista del documento
+        layout.addWidget(splitter)
+        self.setLayout(layout)
+
+    def _document_key(self, filepath):
+        '''
+        Funzione: _document_key
+        Ritorna la chiave di cache di un file, che cambia se il file viene modificato
+
+        Parametri formali:
+        str filepath -> percorso del file PDF
+
+        Valore di ritorno:
+        tuple -> (percorso assoluto, data di ultima modifica)
+        '''
+        path = os.path.abspath(filepath)
+        return (path, os.path.getmtime(path))
+
+    def _get_document(self, key):
+        '''
+        Funzione: _get_document
+        Ritorna il documento dalla cache LRU, caricandolo se necessario
+
+        Parametri formali:
+        tuple key -> chiave del documento (percorso, mtime)
+
+        Valore di ritorno:
+        QPdfDocument|None -> documento caricato, None in caso di errore
+        '''
+        document = self._documents.get(key)
+        if document is not None:
+            self._documents.move_to_end(key)
+            return document
+
+        document = QPdfDocument(self)
+        if document.load(key[0]) != QPdfDocument.Error.None_:
+            document.deleteLater()
+            return None
+
+        self._documents[key] = document
+        # Rimuove i documenti usati meno di recente oltre il limite della cache
+        while len(self._documents) > DOCUMENT_CACHE_SIZE:
+            _, old_document = self._documents.popitem(last=False)
+            old_document.close()
+            old_document.deleteLater()
+        return document
+
+    def load(self, filepath):
+        '''
+        Funzione: load
+        Mostra il PDF indicato nel pannello
+
+        Parametri formali:
+        str filepath -> percorso del file PDF
+
+        Valore di ritorno:
+        bool -> True se il documento è stato aperto, False altrimenti
+        '''
+        if not os.path.exists(filepath):
+            return False
+        key = self._document_key(filepath)
+        if key == self._current_key:
+            return True
+
+        document = self._get_document(key)
+        if document is None:
+            return False
+
+        self._current_key = key
+        self.view.setDocument(document)
+
+        # Crea solo le voci delle miniature: le immagini vengono generate quando visibili
+        self.thumbnail_list.blockSignals(True)
+        self.thumbnail_list.clear()
+        self._icon_rows.clear()
+        # La dimensione fissa delle voci evita che le righe vengano calcolate senza miniatura
+        row_size = self._thumbnail_row_size()
+        for page in range(document.pageCount()):
+            item = QListWidgetItem(f"Pagina {page + 1}")
+            item.setSizeHint(row_size)
+            self.thumbnail_list.addItem(item)
+        self.thumbnail_list.setCurrentRow(0)
+        self.thumbnail_list.blockSignals(False)
+
+        # Attende il completamento del layout prima di calcolare le righe visibili
+        QTimer.singleShot(0, self._render_visible_thumbnails)
+        return True
+
+    def _thumbnail_row_size(self):
+        '''
+        Funzione: _thumbnail_row_size
+        Ritorna la dimensione di una voce della colonna miniature (icona con l'etichetta sotto)
+
+        Valore di ritorno:
+        QSize -> dimensione della voce
+        '''
+        icon_size = self.thumbnail_list.iconSize()
+        label_height = self.thumbnail_list.fontMetrics().height()
+        return QSize(icon_size.width() + 10, icon_size.height() + label_height + 10)
+
+    def forget(self, filepath):
+        '''
+        Funzione: forget
+        Rimuove dalle cache il documento e le miniature di un file (es. dopo l'eliminazione)
+
+        Parametri formali:
+        str filepath -> percorso del file PDF
+        '''
+        path = os.path.abspath(filepath)
+        if self._current_key and self._current_key[0] == path:
+            self.view.setDocument(None)
+            self.thumbnail_list.clear()
+            self._icon_rows.clear()
+            self._current_key = None
+        for key in [k for k in self._documents if k[0] == path]:
+            document = self._documents.pop(key)
+            document.close()
+            document.deleteLater()
+        for key in [k for k in self._thumbnails if k[0] == path]:
+            del self._thumbnails[key]
+
+    def _get_thumbnail(self, page):
+        '''
+        Funzione: _get_thumbnail
+        Ritorna la miniatura di una pagina del documento corrente dalla cache LRU,
+        renderizzandola se necessario
+
+        Parametri formali:
+        int page -> indice della pagina (a partire da 0)
+
+        Valore di ritorno:
+        QPixmap -> miniatura della pagina
+        '''
+        key = self._current_key + (page,)
+        pixmap = self._thumbnails.get(key)
+        if pixmap is not None:
+            self._thumbnails.move_to_end(key)
+            return pixmap
+
+        document = self._documents[self._current_key]
+        page_size = document.pagePointSize(page)
+        height = int(THUMBNAIL_WIDTH * page_size.height() / page_size.width()) if page_size.width() else THUMBNAIL_WIDTH
+        pixmap = QPixmap.fromImage(document.render(page, QSize(THUMBNAIL_WIDTH, height)))
+
+        self._thumbnails[key] = pixmap
+        while len(self._thumbnails) > THUMBNAIL_CACHE_SIZE:
+            self._thumbnails.popitem(last=False)
+        return pixmap
+
+    def _render_visible_thumbnails(self):
+        '''
+        Funzione: _render_visible_thumbnails
+        Genera le miniature delle sole righe attualmente visibili nella colonna
+        e rimuove quelle delle righe non più visibili, così che le immagini
+        restino in memoria solo nella cache LRU
+        '''
+        if self._current_key is None or self.thumbnail_list.count() == 0:
+            return
+        viewport = self.thumbnail_list.viewport()
+        # Colonna nascosta, compressa dallo splitter o troppo piccola: nessuna riga visibile
+        if not self.thumbnail_list.isVisible() or viewport.width() <= 0 or viewport.height() <= 10:
+            return
+
+        count = self.thumbnail_list.count()
+        first = self.thumbnail_list.indexAt(QPoint(5, 5)).row()
+        if first < 0:
+            first = 0
+        last = self.thumbnail_list.indexAt(QPoint(5, viewport.height() - 5)).row()
+        if last < 0:
+            # Stima l'ultima riga visibile dall'altezza delle righe, senza arrivare a fine documento
+            row_height = max(1, self.thumbnail_list.visualItemRect(self.thumbnail_list.item(first)).height())
+            last = min(count - 1, first + viewport.height() // row_height + 1)
+
+        visible_rows = set(range(first, last + 1))
+        for row in self._icon_rows - visible_rows:
+            item = self.thumbnail_list.item(row)
+            if item is not None:
+                item.setIcon(QIcon())
+        for row in visible_rows - self._icon_rows:
+            self.thumbnail_list.item(row).setIcon(QIcon(self._get_thumbnail(row)))
+        self._icon_rows = visible_rows
+
+    def _jump_to_page(self, page):
+        '''
+        Funzione: _jump_to_page
+        Porta la vista sulla pagina selezionata nella colonna delle miniature
+
+        Parametri formali:
+        int page -> indice della pagina selezionata
+        '''
+        if page >= 0 and self._current_key is not None:
+            self.view.pageNavigator().jump(page, QPointF())
+
+    def _sync_thumbnail(self, page):
+        '''
+        Funzione: _sync_thumbnail
+        Evidenzia la miniatura della pagina mostrata nella vista
+
+        Parametri formali:
+        int page -> indice della pagina corrente
+        '''
+        self.thumbnail_list.blockSignals(True)
+        self.thumbnail_list.setCurrentRow(page)
+        self.thumbnail_list.blockSignals(False)
+
+    def resizeEvent(self, event):
+        '''
+        Funzione: resizeEvent
+        Aggiorna le miniature visibili quando il pannello viene ridimensionato
+        '''
+        super().resizeEvent(event)
+        self._render_visible_thumbnails()
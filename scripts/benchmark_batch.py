@@ -0,0 +1,81 @@
+'''
+Autore: Francesco Totaro
+Data: 18/07/2025
+Titolo: Progetto Esame Finale
+'''
+
+##
+## Programma di misura
+## Misura il tempo di rendering in batch di snapshot sintetici al variare
+## del numero di processi worker, per verificare la scalabilità con i core.
+## Da eseguire dalla radice del progetto: python3 scripts/benchmark_batch.py
+##
+
+import os
+import sys
+import time
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.batch_renderer import render_reports      # noqa: E402
+
+
+def make_snapshot(index, rows=300):
+    '''
+    Funzione: make_snapshot
+    Crea uno snapshot sintetico con un numero fisso di righe per sezione
+
+    Parametri formali:
+    int index -> indice dello snapshot (usato per variare i dati)
+    int rows  -> numero di righe per sezione (default 300)
+
+    Valore di ritorno:
+    dict -> Dati dello snapshot
+    '''
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "services": [{"Service": f"svc{index}_{i}.service", "State": "active/running", "Description": "Servizio di prova"}
+                     for i in range(rows)],
+        "users": [{"User": "root", "TTY": "pts/0", "Login Time": "2025-07-18 10:00"}],
+        "ports": [{"Proto": "tcp", "Local Address": f"0.0.0.0:{1000 + i}", "Process": f"proc{i % 7}"} for i in range(rows)],
+        "etc": [{"File": f"/etc/dir{i % 40}/file{index}_{i}.conf", "Last Modified": "2025-07-18 10:00:00"}
+                for i in range(rows)]
+    }
+
+
+def main():
+    '''
+    Funzione: main
+    Esegue il rendering dello stesso insieme di snapshot con 1, 2, 4, ... worker
+    e stampa tempo, report al secondo e accelerazione rispetto a un solo worker
+    '''
+    reports = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    cores = os.cpu_count() or 1
+    snapshots = [make_snapshot(i) for i in range(reports)]
+
+    worker_counts = []
+    workers = 1
+    while workers < cores:
+        worker_counts.append(workers)
+        workers *= 2
+    worker_counts.append(cores)
+
+    baseline = None
+    with tempfile.TemporaryDirectory() as out_dir:
+        jobs = [(os.path.join(out_dir, f"report_{i}.pdf"), snap) for i, snap in enumerate(snapshots)]
+        for workers in worker_counts:
+            start = time.perf_counter()
+            results = render_reports(jobs, max_workers=workers, chunksize=max(1, reports // (workers * 4)))
+            elapsed = time.perf_counter() - start
+            errors = [error for _, error in results if error is not None]
+            if errors:
+                print(f"worker: {workers:3d}  {len(errors)} report non generati, es.: {errors[0]}")
+            baseline = baseline or elapsed
+            print(f"worker: {workers:3d}  tempo: {elapsed:7.2f}s  report/s: {reports / elapsed:7.1f}  "
+                  f"accelerazione: {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
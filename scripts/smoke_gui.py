@@ -0,0 +1,87 @@
+'''
+Autore: Francesco Totaro
+Data: 18/07/2025
+Titolo: Progetto Esame Finale
+'''
+
+##
+## Programma di verifica
+## Costruisce la GUI senza display (piattaforma Qt "offscreen") e, se QtPdf
+## è disponibile, apre nel visualizzatore integrato un PDF di molte pagine
+## controllando che vengano generate solo le miniature visibili.
+## Da eseguire dalla radice del progetto: python3 scripts/smoke_gui.py
+##
+
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fpdf import FPDF                                # noqa: E402
+from PyQt6.QtWidgets import QApplication             # noqa: E402
+from gui.main_gui import MainGUI                     # noqa: E402
+from gui.pdf_viewer import HAS_QTPDF                 # noqa: E402
+
+
+def make_pdf(path, pages):
+    '''
+    Funzione: make_pdf
+    Crea un PDF di prova con il numero di pagine indicato
+
+    Parametri formali:
+    str path  -> percorso del file PDF da creare
+    int pages -> numero di pagine
+    '''
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=24)
+    for page in range(pages):
+        pdf.add_page()
+        pdf.cell(0, 20, f"Pagina {page + 1}")
+    pdf.output(path)
+
+
+def main():
+    '''
+    Funzione: main
+    Esegue i controlli e termina con codice 1 al primo controllo fallito
+    '''
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    app = QApplication(sys.argv)
+    window = MainGUI()
+    window.show()
+    app.processEvents()
+    print("MainGUI costruita")
+
+    if not HAS_QTPDF:
+        print("QtPdf non disponibile: visualizzatore integrato non verificato")
+        return
+
+    viewer = window.pdf_viewer
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "smoke.pdf")
+        make_pdf(path, pages)
+        if not viewer.load(path):
+            print("Errore: il PDF di prova non è stato aperto")
+            sys.exit(1)
+        app.processEvents()
+
+        thumbnails = viewer.thumbnail_list
+        row_height = thumbnails.visualItemRect(thumbnails.item(0)).height()
+        rendered = len(viewer._icon_rows)
+        print(f"pagine: {pages}  altezza riga: {row_height}px  miniature generate: {rendered}")
+
+        if row_height < thumbnails.iconSize().height():
+            print("Errore: le righe sono più basse delle miniature")
+            sys.exit(1)
+        if rendered == 0 or rendered > thumbnails.viewport().height() // row_height + 2:
+            print("Errore: il numero di miniature generate non corrisponde alle righe visibili")
+            sys.exit(1)
+
+        viewer.forget(path)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()